@@ -1,4 +1,5 @@
 """Base class for the AutoML algorithms which power EvalML."""
+import math
 from abc import ABC, abstractmethod
 
 from evalml.exceptions import PipelineNotFoundError
@@ -6,6 +7,9 @@ from evalml.pipelines.utils import _make_stacked_ensemble_pipeline
 from evalml.problem_types import is_multiclass
 from evalml.tuners import SKOptTuner
 
+_EARLY_STOP_TOP_K = 5
+_EARLY_STOP_MIN_RESULTS = 10
+
 
 class AutoMLAlgorithmException(Exception):
     """Exception raised when an error is encountered during the computation of the automl algorithm."""
@@ -26,6 +30,8 @@ class AutoMLAlgorithm(ABC):
         tuner_class (class): A subclass of Tuner, to be used to find parameters for each pipeline. The default of None indicates the SKOptTuner will be used.
         text_in_ensembling (boolean): If True and ensembling is True, then n_jobs will be set to 1 to avoid downstream sklearn stacking issues related to nltk. Defaults to None.
         random_seed (int): Seed for the random number generator. Defaults to 0.
+        early_stop_tol (float): If set, the algorithm recommends stopping once at least 10 results have been recorded and the best 5 scores are within this
+            relative difference of each other. Defaults to None, which never recommends stopping.
     """
 
     def __init__(
@@ -36,22 +42,23 @@ class AutoMLAlgorithm(ABC):
         text_in_ensembling=False,
         random_seed=0,
         n_jobs=-1,
+        early_stop_tol=None,
     ):
         self.random_seed = random_seed
         self.allowed_pipelines = allowed_pipelines or []
         self._tuner_class = tuner_class or SKOptTuner
         self._tuners = {}
+        self._tuner_specs = {}
         self._best_pipeline_info = {}
+        self._score_history = []
+        self.early_stop_tol = early_stop_tol
         self.text_in_ensembling = text_in_ensembling
         self.n_jobs = n_jobs
         self._selected_cols = None
         for pipeline in self.allowed_pipelines:
-            pipeline_hyperparameters = pipeline.get_hyperparameter_ranges(
+            self._tuner_specs[pipeline.name] = pipeline.get_hyperparameter_ranges(
                 custom_hyperparameters
             )
-            self._tuners[pipeline.name] = self._tuner_class(
-                pipeline_hyperparameters, random_seed=self.random_seed
-            )
         self._pipeline_number = 0
         self._batch_number = 0
         self._default_max_batches = 1
@@ -84,11 +91,51 @@ class AutoMLAlgorithm(ABC):
         Raises:
             PipelineNotFoundError: If pipeline is not allowed in search.
         """
-        if pipeline.name not in self._tuners:
+        if pipeline.name not in self._tuner_specs:
             raise PipelineNotFoundError(
                 f"No such pipeline allowed in this AutoML search: {pipeline.name}"
             )
-        self._tuners[pipeline.name].add(pipeline.parameters, score_to_minimize)
+        self._record_score(score_to_minimize)
+        self._get_tuner(pipeline.name).add(pipeline.parameters, score_to_minimize)
+
+    def _get_tuner(self, pipeline_name):
+        """Returns the tuner for a pipeline, creating it the first time it is requested.
+
+        Args:
+            pipeline_name (str): Name of the pipeline.
+
+        Returns:
+            Tuner: The tuner used to find parameters for the pipeline.
+        """
+        if pipeline_name not in self._tuners:
+            pipeline_hyperparameters = self._tuner_specs[pipeline_name]
+            self._tuners[pipeline_name] = self._tuner_class(
+                pipeline_hyperparameters, random_seed=self.random_seed
+            )
+        return self._tuners[pipeline_name]
+
+    def _record_score(self, score_to_minimize):
+        """Records a pipeline score for the early stopping check, ignoring missing scores.
+
+        Called by add_result. Subclasses which register a result without calling AutoMLAlgorithm.add_result should call this instead.
+
+        Args:
+            score_to_minimize (float): The score obtained by a pipeline on the primary objective, converted so that lower values indicate better pipelines.
+        """
+        if score_to_minimize is not None and not math.isnan(score_to_minimize):
+            self._score_history.append(score_to_minimize)
+
+    @property
+    def should_stop(self):
+        """Returns whether the best scores recorded so far have converged, meaning further batches are unlikely to improve on them."""
+        if (
+            self.early_stop_tol is None
+            or len(self._score_history) < _EARLY_STOP_MIN_RESULTS
+        ):
+            return False
+        best_scores = sorted(self._score_history)[:_EARLY_STOP_TOP_K]
+        spread = (best_scores[-1] - best_scores[0]) / max(abs(best_scores[0]), 1e-9)
+        return spread < self.early_stop_tol
 
     @property
     def pipeline_number(self):
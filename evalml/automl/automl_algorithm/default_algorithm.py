@@ -71,6 +71,7 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         allow_long_running_models (bool): Whether or not to allow longer-running models for large multiclass problems. If False and no pipelines, component graphs, or model families are provided,
             AutoMLSearch will not use Elastic Net or XGBoost when there are more than 75 multiclass targets and will not use CatBoost when there are more than 150 multiclass targets. Defaults to False.
         verbose (boolean): Whether or not to display logging information regarding pipeline building. Defaults to False.
+        early_stop_tol (float): If set, the algorithm recommends stopping once the best 5 scores are within this relative difference of each other. Defaults to None.
     """
 
     def __init__(
@@ -90,12 +91,14 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         num_long_pipelines_per_batch=10,
         allow_long_running_models=False,
         verbose=False,
+        early_stop_tol=None,
     ):
         super().__init__(
             allowed_pipelines=[],
             custom_hyperparameters=custom_hyperparameters,
-            tuner_class=None,
+            tuner_class=tuner_class,
             random_seed=random_seed,
+            early_stop_tol=early_stop_tol,
         )
         self.X = infer_feature_types(X)
         self.y = infer_feature_types(y)
@@ -166,12 +169,10 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         return estimators
 
     def _create_tuner(self, pipeline):
-        pipeline_hyperparameters = pipeline.get_hyperparameter_ranges(
+        self._tuner_specs[pipeline.name] = pipeline.get_hyperparameter_ranges(
             self._custom_hyperparameters
         )
-        self._tuners[pipeline.name] = self._tuner_class(
-            pipeline_hyperparameters, random_seed=self.random_seed
-        )
+        self._tuners.pop(pipeline.name, None)
 
     def _create_pipelines_with_params(self, pipelines, parameters={}):
         return [
@@ -314,11 +315,11 @@ class DefaultAlgorithm(AutoMLAlgorithm):
         next_batch = []
         for _ in range(n):
             for pipeline in pipelines:
-                if pipeline.name not in self._tuners:
+                if pipeline.name not in self._tuner_specs:
                     self._create_tuner(pipeline)
 
                 select_parameters = self._create_select_parameters()
-                proposed_parameters = self._tuners[pipeline.name].propose()
+                proposed_parameters = self._get_tuner(pipeline.name).propose()
                 parameters = self._transform_parameters(pipeline, proposed_parameters)
                 parameters.update(select_parameters)
                 next_batch.append(
@@ -410,11 +411,10 @@ class DefaultAlgorithm(AutoMLAlgorithm):
             pipeline (PipelineBase): The trained pipeline object which was used to compute the score.
             trained_pipeline_results (dict): Results from training a pipeline.
         """
-        if pipeline.model_family != ModelFamily.ENSEMBLE:
-            if self.batch_number >= 3:
-                super().add_result(
-                    score_to_minimize, pipeline, trained_pipeline_results
-                )
+        if pipeline.model_family != ModelFamily.ENSEMBLE and self.batch_number >= 3:
+            super().add_result(score_to_minimize, pipeline, trained_pipeline_results)
+        else:
+            self._record_score(score_to_minimize)
 
         if (
             self.batch_number == 2
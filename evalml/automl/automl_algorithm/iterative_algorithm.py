@@ -63,6 +63,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         allow_long_running_models (bool): Whether or not to allow longer-running models for large multiclass problems. If False and no pipelines, component graphs, or model families are provided,
             AutoMLSearch will not use Elastic Net or XGBoost when there are more than 75 multiclass targets and will not use CatBoost when there are more than 150 multiclass targets. Defaults to False.
         verbose (boolean): Whether or not to display logging information regarding pipeline building. Defaults to False.
+        early_stop_tol (float): If set, the algorithm recommends stopping once the best 5 scores are within this relative difference of each other. Defaults to None.
     """
 
     def __init__(
@@ -87,6 +88,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
         _estimator_family_order=None,
         allow_long_running_models=False,
         verbose=False,
+        early_stop_tol=None,
     ):
         self.X = infer_feature_types(X)
         self.y = infer_feature_types(y)
@@ -126,6 +128,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             text_in_ensembling=self.text_in_ensembling,
             random_seed=random_seed,
             n_jobs=self.n_jobs,
+            early_stop_tol=early_stop_tol,
         )
 
         if custom_hyperparameters and not isinstance(custom_hyperparameters, dict):
@@ -321,7 +324,7 @@ class IterativeAlgorithm(AutoMLAlgorithm):
             idx = (self._batch_number - 1) % num_pipelines
             pipeline = self._first_batch_results[idx][1]
             for i in range(self.pipelines_per_batch):
-                proposed_parameters = self._tuners[pipeline.name].propose()
+                proposed_parameters = self._get_tuner(pipeline.name).propose()
                 parameters = self._transform_parameters(pipeline, proposed_parameters)
                 next_batch.append(
                     pipeline.new(parameters=parameters, random_seed=self.random_seed)
@@ -360,6 +363,8 @@ class IterativeAlgorithm(AutoMLAlgorithm):
                 super().add_result(
                     score_to_minimize, pipeline, trained_pipeline_results
                 )
+        else:
+            self._record_score(score_to_minimize)
         if self.batch_number == 1:
             self._first_batch_results.append((score_to_minimize, pipeline))
         current_best_score = self._best_pipeline_info.get(
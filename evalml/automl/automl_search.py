@@ -409,6 +409,9 @@ class AutoMLSearch:
             If a parallel engine is selected this way, the maximum amount of parallelism, as determined by the engine, will be used. Defaults to "sequential".
 
         verbose (boolean): Whether or not to display semi-real-time updates to stdout while search is running. Defaults to False.
+
+        early_stop_tol (float): If set, stops the search before starting a new batch once at least 10 pipelines have been evaluated and the
+            best 5 scores are within this relative difference of each other. Must be non-negative. If None, this check is disabled. Defaults to None.
     """
 
     _MAX_NAME_LEN = 40
@@ -449,6 +452,7 @@ class AutoMLSearch:
         automl_algorithm="default",
         engine="sequential",
         verbose=False,
+        early_stop_tol=None,
     ):
         self.verbose = verbose
         if verbose:
@@ -576,6 +580,12 @@ class AutoMLSearch:
         self.patience = patience
         self.tolerance = tolerance or 0.0
 
+        if early_stop_tol is not None and early_stop_tol < 0:
+            raise ValueError(
+                f"early_stop_tol value must be non-negative. Received {early_stop_tol} instead"
+            )
+        self.early_stop_tol = early_stop_tol
+
         self._results = {
             "pipeline_results": {},
             "search_order": [],
@@ -706,6 +716,7 @@ class AutoMLSearch:
                 custom_hyperparameters=custom_hyperparameters,
                 allow_long_running_models=allow_long_running_models,
                 verbose=self.verbose,
+                early_stop_tol=self.early_stop_tol,
             )
         elif automl_algorithm == "default":
             self.automl_algorithm = DefaultAlgorithm(
@@ -720,6 +731,7 @@ class AutoMLSearch:
                 text_in_ensembling=text_in_ensembling,
                 allow_long_running_models=allow_long_running_models,
                 verbose=self.verbose,
+                early_stop_tol=self.early_stop_tol,
             )
         else:
             raise ValueError("Please specify a valid automl algorithm.")
@@ -784,6 +796,7 @@ class AutoMLSearch:
             f"Allowed Pipelines: \n{_print_list(self.allowed_pipelines or [])}\n"
             f"Patience: {self.patience}\n"
             f"Tolerance: {self.tolerance}\n"
+            f"Early Stop Tolerance: {self.early_stop_tol}\n"
             f"Data Splitting: {self.data_splitter}\n"
             f"Tuner: {self.tuner_class.__name__}\n"
             f"Start Iteration Callback: {_get_funct_name(self.start_iteration_callback)}\n"
@@ -906,6 +919,11 @@ class AutoMLSearch:
             computations = []
             try:
                 if not loop_interrupted:
+                    if self.automl_algorithm.should_stop:
+                        self.logger.info(
+                            "\n\nBest pipeline scores have converged. Stopping search early..."
+                        )
+                        break
                     current_batch_pipelines = self.automl_algorithm.next_batch()
             except StopIteration:
                 self.logger.info("AutoML Algorithm out of recommendations, ending")
@@ -2,7 +2,8 @@
 from woodwork import init_series
 
 from evalml.pipelines.components.transformers import Transformer
-from evalml.utils import drop_rows_with_nans, infer_feature_types
+from evalml.utils import drop_rows_with_nans
+from evalml.utils.woodwork_utils import _infer_feature_types_with_schema
 
 
 class DropNaNRowsTransformer(Transformer):
@@ -17,6 +18,16 @@ class DropNaNRowsTransformer(Transformer):
     hyperparameter_ranges = {}
     """{}"""
 
+    def __init__(self, random_seed=0, **kwargs):
+        parameters = {}
+        parameters.update(kwargs)
+
+        self._X_schema = None
+        self._y_schema = None
+        super().__init__(
+            parameters=parameters, component_obj=None, random_seed=random_seed
+        )
+
     def fit(self, X, y=None):
         """Fits component to data.
 
@@ -27,6 +38,8 @@ class DropNaNRowsTransformer(Transformer):
         Returns:
             self
         """
+        self._X_schema = None
+        self._y_schema = None
         return self
 
     def transform(self, X, y=None):
@@ -39,16 +52,26 @@ class DropNaNRowsTransformer(Transformer):
         Returns:
             (pd.DataFrame, pd.Series): Data with NaN rows dropped.
         """
-        X_t = infer_feature_types(X)
-        y_t = infer_feature_types(y) if y is not None else None
+        X_t = _infer_feature_types_with_schema(X, self._X_schema)
+        y_t = (
+            _infer_feature_types_with_schema(y, self._y_schema)
+            if y is not None
+            else None
+        )
 
         X_t_schema = X_t.ww.schema
+        # Keep the schema inferred for the first data seen so later calls on pandas data can reuse it.
+        if self._X_schema is None:
+            self._X_schema = X_t_schema
         if y_t is not None:
             y_t_logical = y_t.ww.logical_type
             y_t_semantic = y_t.ww.semantic_tags
+            if self._y_schema is None:
+                self._y_schema = y_t.ww.schema
 
         X_t, y_t = drop_rows_with_nans(X_t, y_t)
-        X_t.ww.init_with_full_schema(X_t_schema)
+        # Selecting rows keeps the columns and dtypes the schema was validated against.
+        X_t.ww.init_with_full_schema(X_t_schema, validate=False)
         if y_t is not None:
             y_t = init_series(y_t, logical_type=y_t_logical, semantic_tags=y_t_semantic)
         return X_t, y_t
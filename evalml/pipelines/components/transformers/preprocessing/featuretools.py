@@ -1,9 +1,12 @@
 """Featuretools DFS component that generates features for the input features."""
+import numpy as np
+import pandas as pd
 from featuretools import EntitySet, calculate_feature_matrix, dfs
 from featuretools.feature_base import IdentityFeature
 
 from evalml.pipelines.components.transformers.transformer import Transformer
 from evalml.utils import infer_feature_types
+from evalml.utils.woodwork_utils import _infer_feature_types_with_schema
 
 
 class DFSTransformer(Transformer):
@@ -14,20 +17,34 @@ class DFSTransformer(Transformer):
             then featuretools.EntitySet() creates a column with this name to serve as the index column. Defaults to 'index'.
         random_seed (int): Seed for the random number generator. Defaults to 0.
         features (list)[FeatureBase]: List of features to run DFS on. Defaults to None. Features will only be computed if the columns used by the feature exist in the input and if the feature itself is not in input.
+        ft_n_jobs (int): Number of parallel processes featuretools uses to calculate the feature matrix. If set to -1, all CPUs are used. Named apart from the
+            n_jobs parameter that AutoML sets on components, since featuretools starts a dask cluster whenever this is not 1. Defaults to 1.
+        chunk_size (int, float, None): Maximum number of rows of the feature matrix featuretools calculates at a time. If a float between 0 and 1, the fraction of rows per chunk.
+            If None, featuretools picks the chunk size. Defaults to None.
     """
 
     name = "DFS Transformer"
     hyperparameter_ranges = {}
     """{}"""
 
-    def __init__(self, index="index", features=None, random_seed=0, **kwargs):
-        parameters = {"index": index}
+    def __init__(
+        self,
+        index="index",
+        features=None,
+        ft_n_jobs=1,
+        chunk_size=None,
+        random_seed=0,
+        **kwargs,
+    ):
+        parameters = {"index": index, "ft_n_jobs": ft_n_jobs, "chunk_size": chunk_size}
         if not isinstance(index, str):
             raise TypeError(f"Index provided must be string, got {type(index)}")
 
         self.index = index
         self.features = features
         self._passed_in_features = True if features else None
+        self._X_schema = None
+        self._feature_column_sets = None
         parameters.update(kwargs)
         super().__init__(parameters=parameters, random_seed=random_seed)
 
@@ -45,27 +62,42 @@ class DFSTransformer(Transformer):
             es = ft_es.add_dataframe(dataframe=X, dataframe_name="X", index=self.index)
         return es
 
+    def _calculate_identity_feature_matrix(self, X, features):
+        """Helper method that computes the feature matrix for identity features by selecting their columns, indexed the same way featuretools would index it."""
+        if self.index in X.columns:
+            index = pd.Index(X[self.index], name=self.index)
+        else:
+            index = pd.Index(np.arange(len(X)), name=self.index)
+        feature_matrix = X[[feature.column_name for feature in features]]
+        return feature_matrix.set_axis(index, axis=0)
+
+    def _get_feature_column_sets(self):
+        """Helper method that returns each feature with the set of columns it requires and the set of columns it generates."""
+        return [
+            (
+                feature,
+                frozenset(f.column_name for f in feature.base_features),
+                frozenset(feature.get_feature_names()),
+            )
+            for feature in self.features
+        ]
+
     def _filter_features(self, X):
         features_to_use = []
-        X_columns_set = set(X.columns)
-        for feature in self.features:
-            input_cols = [f.column_name for f in feature.base_features]
-
+        X_columns_set = frozenset(X.columns)
+        for feature, input_cols, feature_names in self._feature_column_sets:
             # If feature is an identity feature and the column doesn't exist, skip feature
-            if (
-                isinstance(feature, IdentityFeature)
-                and feature.column_name not in X.columns
-            ):
+            if isinstance(feature, IdentityFeature):
+                if feature.column_name in X_columns_set:
+                    features_to_use.append(feature)
                 continue
 
             # If feature's required columns doesn't exist, skip feature
-            if not set(input_cols).issubset(X_columns_set):
+            if not input_cols <= X_columns_set:
                 continue
 
             # If feature's transformed columns already exist, skip feature
-            if not isinstance(feature, IdentityFeature) and set(
-                feature.get_feature_names()
-            ).intersection(X_columns_set):
+            if not feature_names.isdisjoint(X_columns_set):
                 continue
 
             features_to_use.append(feature)
@@ -81,8 +113,12 @@ class DFSTransformer(Transformer):
         Returns:
             self
         """
-        if not self._passed_in_features:
+        self._X_schema = None
+        if self._passed_in_features:
+            self._feature_column_sets = self._get_feature_column_sets()
+        else:
             X_ww = infer_feature_types(X)
+            self._X_schema = X_ww.ww.schema
             X_ww = X_ww.ww.rename({col: str(col) for col in X_ww.columns})
             es = self._make_entity_set(X_ww)
             self.features = dfs(
@@ -100,7 +136,10 @@ class DFSTransformer(Transformer):
         Returns:
             pd.DataFrame: Feature matrix
         """
-        X_ww = infer_feature_types(X)
+        X_ww = _infer_feature_types_with_schema(X, self._X_schema)
+        # Keep the schema inferred for the first data seen so later calls on pandas data can reuse it.
+        if self._X_schema is None:
+            self._X_schema = X_ww.ww.schema
         X_ww = X_ww.ww.rename({col: str(col) for col in X_ww.columns})
 
         features_to_use = (
@@ -109,10 +148,21 @@ class DFSTransformer(Transformer):
         all_identity = all([isinstance(f, IdentityFeature) for f in features_to_use])
         if not features_to_use or (all_identity and self._passed_in_features):
             return X_ww
-        es = self._make_entity_set(X_ww)
-        feature_matrix = calculate_feature_matrix(
-            features=features_to_use, entityset=es
-        )
+        # Featuretools validates that the index column is unique, so only take the shortcut when that holds
+        if all_identity and (
+            self.index not in X_ww.columns or X_ww[self.index].is_unique
+        ):
+            feature_matrix = self._calculate_identity_feature_matrix(
+                X_ww, features_to_use
+            )
+        else:
+            es = self._make_entity_set(X_ww)
+            feature_matrix = calculate_feature_matrix(
+                features=features_to_use,
+                entityset=es,
+                n_jobs=self.parameters["ft_n_jobs"],
+                chunk_size=self.parameters["chunk_size"],
+            )
         typed_columns = set(X_ww.columns).intersection(set(feature_matrix.columns))
         feature_matrix.ww.init(schema=X_ww.ww.schema.get_subset_schema(typed_columns))
         return feature_matrix
@@ -464,6 +464,7 @@ def test_automl_str_search(
         "max_iterations": 5,
         "patience": 2,
         "tolerance": 0.5,
+        "early_stop_tol": 0.2,
         "allowed_model_families": ["random_forest", "linear_model"],
         "data_splitter": StratifiedKFold(n_splits=5),
         "tuner_class": RandomSearchTuner,
@@ -481,6 +482,7 @@ def test_automl_str_search(
         "Allowed Pipelines": [],
         "Patience": search_params["patience"],
         "Tolerance": search_params["tolerance"],
+        "Early Stop Tolerance": search_params["early_stop_tol"],
         "Data Splitting": "StratifiedKFold(n_splits=5, random_state=None, shuffle=False)",
         "Tuner": "RandomSearchTuner",
         "Start Iteration Callback": "_dummy_callback",
@@ -528,6 +530,7 @@ def test_automl_str_no_param_search(X_y_binary):
         "Allowed Pipelines": [],
         "Patience": "None",
         "Tolerance": "0.0",
+        "Early Stop Tolerance": "None",
         "Data Splitting": "StratifiedKFold(n_splits=5, random_state=None, shuffle=False)",
         "Tuner": "SKOptTuner",
         "Additional Objectives": [
@@ -577,6 +580,25 @@ def test_automl_tuner_exception(
             automl.search()
 
 
+@pytest.mark.parametrize("automl_algorithm", ["iterative", "default"])
+@pytest.mark.parametrize(
+    "tuner_class,expected_tuner_class",
+    [(None, SKOptTuner), (RandomSearchTuner, RandomSearchTuner)],
+)
+def test_automl_tuner_class_passed_to_algorithm(
+    tuner_class, expected_tuner_class, automl_algorithm, X_y_binary
+):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        tuner_class=tuner_class,
+        automl_algorithm=automl_algorithm,
+    )
+    assert automl.automl_algorithm._tuner_class == expected_tuner_class
+
+
 @patch("evalml.automl.automl_algorithm.DefaultAlgorithm.next_batch")
 def test_automl_algorithm(
     mock_algo_next_batch,
@@ -2338,6 +2360,17 @@ def test_early_stopping_negative(X_y_binary):
             tolerance=1.5,
             random_seed=0,
         )
+    with pytest.raises(ValueError, match="early_stop_tol value must be non-negative"):
+        AutoMLSearch(
+            X_train=X,
+            y_train=y,
+            problem_type="binary",
+            objective="AUC",
+            max_iterations=5,
+            allowed_model_families=["linear_model"],
+            early_stop_tol=-0.1,
+            random_seed=0,
+        )
 
 
 @pytest.mark.parametrize("verbose", [True, False])
@@ -2380,6 +2413,41 @@ def test_early_stopping(
     ) == verbose
 
 
+@pytest.mark.parametrize("automl_algorithm", ["iterative", "default"])
+@pytest.mark.parametrize("early_stop_tol", [None, 0.1])
+def test_early_stop_tol(
+    early_stop_tol, automl_algorithm, AutoMLTestEnv, X_y_binary, caplog
+):
+    X, y = X_y_binary
+    automl = AutoMLSearch(
+        X_train=X,
+        y_train=y,
+        problem_type="binary",
+        optimize_thresholds=False,
+        max_iterations=None,
+        max_batches=10,
+        automl_algorithm=automl_algorithm,
+        early_stop_tol=early_stop_tol,
+        verbose=True,
+    )
+    assert automl.automl_algorithm.early_stop_tol == early_stop_tol
+    env = AutoMLTestEnv("binary")
+    with env.test_context(score_return_value={"Log Loss Binary": 0.3}):
+        with patch.object(
+            automl.automl_algorithm,
+            "next_batch",
+            wraps=automl.automl_algorithm.next_batch,
+        ) as mock_next_batch:
+            automl.search()
+
+    stopped_early = early_stop_tol is not None
+    assert automl.automl_algorithm.should_stop == stopped_early
+    assert (mock_next_batch.call_count < 10) == stopped_early
+    assert (
+        "Best pipeline scores have converged. Stopping search early." in caplog.text
+    ) == stopped_early
+
+
 @pytest.mark.parametrize("max_batches", [1, 2, 5, 10])
 @pytest.mark.parametrize("verbose", [True, False])
 def test_max_batches_output(max_batches, verbose, AutoMLTestEnv, X_y_binary, caplog):
@@ -1,3 +1,6 @@
+from unittest.mock import patch
+
+import numpy as np
 import pytest
 
 from evalml.automl.automl_algorithm import AutoMLAlgorithm
@@ -5,8 +8,8 @@ from evalml.exceptions import PipelineNotFoundError
 
 
 class DummyAlgorithm(AutoMLAlgorithm):
-    def __init__(self, dummy_pipelines=None):
-        super().__init__()
+    def __init__(self, dummy_pipelines=None, **kwargs):
+        super().__init__(**kwargs)
         self._dummy_pipelines = dummy_pipelines or []
 
     def next_batch(self):
@@ -48,3 +51,47 @@ def test_automl_algorithm_invalid_pipeline_add(dummy_regression_pipeline):
         match="No such pipeline allowed in this AutoML search: Mock Regression Pipeline",
     ):
         algo.add_result(0.1234, dummy_regression_pipeline, {})
+
+
+@patch("evalml.tuners.skopt_tuner.SKOptTuner.add")
+def test_automl_algorithm_creates_tuners_lazily(
+    mock_tuner_add, dummy_binary_pipeline, dummy_regression_pipeline
+):
+    algo = DummyAlgorithm(
+        allowed_pipelines=[dummy_binary_pipeline, dummy_regression_pipeline]
+    )
+    assert algo._tuners == {}
+    assert set(algo._tuner_specs) == {
+        dummy_binary_pipeline.name,
+        dummy_regression_pipeline.name,
+    }
+
+    algo.add_result(0.1234, dummy_binary_pipeline, {})
+    tuner = algo._tuners[dummy_binary_pipeline.name]
+    assert list(algo._tuners) == [dummy_binary_pipeline.name]
+    mock_tuner_add.assert_called_once_with(dummy_binary_pipeline.parameters, 0.1234)
+    assert algo._get_tuner(dummy_binary_pipeline.name) is tuner
+
+
+@pytest.mark.parametrize(
+    "early_stop_tol,scores,should_stop",
+    [
+        (None, [1.0] * 10, False),
+        (0.1, [1.0] * 9, False),
+        (0.1, [1.0] * 9 + [np.nan], False),
+        (0.1, [1.0] * 10, True),
+        (0.1, [1.0, 1.05, 1.08, 1.09, 1.095] + [5.0] * 5, True),
+        (0.1, [1.0, 1.05, 1.08, 1.09, 1.2] + [5.0] * 5, False),
+        (0.1, [-1.0, -1.05, -1.02, -1.08, -1.03] + [5.0] * 5, True),
+    ],
+)
+@patch("evalml.tuners.skopt_tuner.SKOptTuner.add")
+def test_automl_algorithm_should_stop(
+    mock_tuner_add, early_stop_tol, scores, should_stop, dummy_binary_pipeline
+):
+    algo = DummyAlgorithm(
+        allowed_pipelines=[dummy_binary_pipeline], early_stop_tol=early_stop_tol
+    )
+    for score in scores:
+        algo.add_result(score, dummy_binary_pipeline, {})
+    assert algo.should_stop == should_stop
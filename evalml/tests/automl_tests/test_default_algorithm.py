@@ -18,6 +18,7 @@ from evalml.pipelines.components import (
     StackedEnsembleRegressor,
 )
 from evalml.problem_types import ProblemTypes
+from evalml.tuners import RandomSearchTuner, SKOptTuner
 
 
 def test_default_algorithm_init(X_y_binary):
@@ -41,6 +42,28 @@ def test_default_algorithm_init(X_y_binary):
     assert algo.default_max_batches == 3
 
 
+@pytest.mark.parametrize(
+    "tuner_class,expected_tuner_class",
+    [(None, SKOptTuner), (RandomSearchTuner, RandomSearchTuner)],
+)
+def test_default_algorithm_tuner_class(
+    tuner_class, expected_tuner_class, dummy_binary_pipeline, X_y_binary
+):
+    X, y = X_y_binary
+    algo = DefaultAlgorithm(
+        X, y, ProblemTypes.BINARY, "Undersampler", tuner_class=tuner_class
+    )
+    algo._create_tuner(dummy_binary_pipeline)
+    assert dummy_binary_pipeline.name in algo._tuner_specs
+    assert dummy_binary_pipeline.name not in algo._tuners
+    tuner = algo._get_tuner(dummy_binary_pipeline.name)
+    assert isinstance(tuner, expected_tuner_class)
+    assert algo._tuners[dummy_binary_pipeline.name] is tuner
+
+    algo._create_tuner(dummy_binary_pipeline)
+    assert dummy_binary_pipeline.name not in algo._tuners
+
+
 def test_default_algorithm_custom_hyperparameters_error(X_y_binary):
     X, y = X_y_binary
     problem_type = ProblemTypes.BINARY
@@ -186,7 +209,7 @@ def test_default_algorithm(
                 pipeline.parameters["Select Columns Transformer"]["columns"]
                 == categorical_columns
             )
-        assert algo._tuners[pipeline.name]
+        assert pipeline.name in algo._tuner_specs
     add_result(algo, final_batch)
 
     final_ensemble = algo.next_batch()
@@ -195,6 +218,7 @@ def test_default_algorithm(
         (StackedEnsembleClassifier, StackedEnsembleRegressor),
     )
     add_result(algo, final_ensemble)
+    assert len(algo._score_history) == algo.pipeline_number
 
     long_explore = algo.next_batch()
 
@@ -604,7 +628,7 @@ def test_default_algorithm_time_series(
             pipeline.estimator, (ElasticNetClassifier, ElasticNetRegressor)
         ):
             assert pipeline.model_family not in naive_model_families
-        assert algo._tuners[pipeline.name]
+        assert pipeline.name in algo._tuner_specs
         assert pipeline.parameters["pipeline"] == pipeline_params["pipeline"]
         if not isinstance(pipeline.estimator, (ARIMARegressor, ProphetRegressor)):
             assert pipeline.parameters["DateTime Featurizer"]["time_index"]
@@ -706,7 +730,7 @@ def test_default_algorithm_time_series_known_in_advance(
             pipeline.estimator, (ElasticNetClassifier, ElasticNetRegressor)
         ):
             assert pipeline.model_family not in naive_model_families
-        assert algo._tuners[pipeline.name]
+        assert pipeline.name in algo._tuner_specs
         assert pipeline.parameters["pipeline"] == pipeline_params["pipeline"]
         assert (
             pipeline.parameters[
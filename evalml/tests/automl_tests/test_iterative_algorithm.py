@@ -261,6 +261,7 @@ def test_iterative_algorithm_results(
             ]
             assert all(random_seeds_the_same)
             assert ModelFamily.ENSEMBLE not in algo._best_pipeline_info
+        assert len(algo._score_history) == algo.pipeline_number
 
 
 @patch("evalml.tuners.skopt_tuner.Optimizer.tell")
@@ -391,6 +392,29 @@ def test_iterative_algorithm_passes_n_jobs_catboost_xgboost(
                 algo.add_result(score, pipeline, {"id": algo.pipeline_number})
 
 
+@patch("evalml.tuners.skopt_tuner.Optimizer.tell")
+def test_iterative_algorithm_dfs_transformer_ft_n_jobs(mock_opt_tell, X_y_binary):
+    X, y = X_y_binary
+    algo = IterativeAlgorithm(
+        X=X,
+        y=y,
+        problem_type="binary",
+        allowed_component_graphs={
+            "graph": ["DFS Transformer", "Random Forest Classifier"]
+        },
+        n_jobs=-1,
+        ensembling=False,
+    )
+    for _ in range(3):
+        next_batch = algo.next_batch()
+        for pipeline in next_batch:
+            assert pipeline.parameters["DFS Transformer"]["ft_n_jobs"] == 1
+            assert "n_jobs" not in pipeline.parameters["DFS Transformer"]
+            assert pipeline.parameters["Random Forest Classifier"]["n_jobs"] == -1
+        for score, pipeline in enumerate(next_batch):
+            algo.add_result(score, pipeline, {"id": algo.pipeline_number})
+
+
 @pytest.mark.parametrize("ensembling_value", [True, False])
 def test_iterative_algorithm_one_allowed_pipeline(
     X_y_binary, ensembling_value, dummy_binary_pipeline_classes
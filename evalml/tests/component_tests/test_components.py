@@ -290,7 +290,7 @@ def test_describe_component():
     }
     assert ft.describe(return_dict=True) == {
         "name": "DFS Transformer",
-        "parameters": {"index": "index"},
+        "parameters": {"index": "index", "ft_n_jobs": 1, "chunk_size": None},
     }
     assert us.describe(return_dict=True) == {
         "name": "Undersampler",
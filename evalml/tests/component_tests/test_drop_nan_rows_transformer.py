@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -7,6 +9,7 @@ from woodwork import init_series
 from evalml.pipelines.components.transformers.preprocessing import (
     DropNaNRowsTransformer,
 )
+from evalml.utils import infer_feature_types
 from evalml.utils.woodwork_utils import _schema_is_equal
 
 
@@ -60,3 +63,28 @@ def test_drop_rows_transformer_retain_ww_schema(null_value):
     assert_series_equal(transformed_y, y_expected)
     assert _schema_is_equal(transformed_X.ww.schema, X_expected_schema)
     assert transformed_y.ww.schema == y_expected_schema
+
+
+@patch("evalml.utils.woodwork_utils.infer_feature_types", wraps=infer_feature_types)
+def test_drop_rows_transformer_reuses_schema(mock_infer_feature_types):
+    X = pd.DataFrame({"a column": [1.5, 2, 3], "another col": [4, 5, 6]})
+    y = pd.Series([1, 0, 1])
+    drop_rows_transformer = DropNaNRowsTransformer()
+    drop_rows_transformer.fit(X, y)
+    mock_infer_feature_types.assert_not_called()
+    drop_rows_transformer.transform(X, y)
+    assert mock_infer_feature_types.call_count == 2
+    mock_infer_feature_types.reset_mock()
+
+    X_nan = pd.DataFrame({"a column": [np.NaN, 2, 3], "another col": [4, 5, 6]})
+    y = pd.Series([1, 0, 1])
+    transformed_X, transformed_y = drop_rows_transformer.transform(X_nan, y)
+    mock_infer_feature_types.assert_not_called()
+    assert_frame_equal(transformed_X, X_nan.iloc[1:])
+    assert_series_equal(transformed_y, y.iloc[1:])
+    assert _schema_is_equal(transformed_X.ww.schema, infer_feature_types(X).ww.schema)
+
+    y_nan = pd.Series([1, np.NaN, 1])
+    transformed_X, transformed_y = drop_rows_transformer.transform(X_nan, y_nan)
+    mock_infer_feature_types.assert_called_once()
+    assert_frame_equal(transformed_X, X_nan.iloc[[2]])
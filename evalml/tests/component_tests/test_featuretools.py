@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import featuretools as ft
 import pandas as pd
@@ -16,6 +16,7 @@ from woodwork.logical_types import (
 
 from evalml.demos import load_diabetes
 from evalml.pipelines.components import DFSTransformer
+from evalml.utils import infer_feature_types
 
 
 def test_index_errors(X_y_binary):
@@ -47,6 +48,7 @@ def test_featuretools_index(mock_calculate_feature_matrix, mock_dfs, X_y_multi):
     new_index = [i * 2 for i in index]
     X_new_index["index"] = new_index
     mock_calculate_feature_matrix.return_value = pd.DataFrame({})
+    mock_dfs.return_value = [MagicMock()]
 
     # check if _make_entity_set keeps the intended index
     feature = DFSTransformer()
@@ -66,6 +68,38 @@ def test_featuretools_index(mock_calculate_feature_matrix, mock_dfs, X_y_multi):
     assert arg_tr.to_list() == index
 
 
+def _absolute_features(X):
+    es = ft.EntitySet()
+    es = es.add_dataframe(
+        dataframe_name="X", dataframe=X, index="index", make_index=True
+    )
+    _, features = ft.dfs(
+        entityset=es, target_dataframe_name="X", trans_primitives=["absolute"]
+    )
+    return [feature for feature in features if not isinstance(feature, IdentityFeature)]
+
+
+@patch(
+    "evalml.pipelines.components.transformers.preprocessing.featuretools.calculate_feature_matrix"
+)
+def test_featuretools_ft_n_jobs_chunk_size(mock_calculate_feature_matrix, X_y_binary):
+    X, _ = X_y_binary
+    X_pd = pd.DataFrame(X)
+    X_pd.columns = X_pd.columns.astype(str)
+    features = _absolute_features(X_pd.copy())
+    mock_calculate_feature_matrix.return_value = X_pd
+
+    feature = DFSTransformer(features=features)
+    feature.fit_transform(X_pd)
+    assert mock_calculate_feature_matrix.call_args[1]["n_jobs"] == 1
+    assert mock_calculate_feature_matrix.call_args[1]["chunk_size"] is None
+
+    feature = DFSTransformer(features=features, ft_n_jobs=2, chunk_size=0.5)
+    feature.fit_transform(X_pd)
+    assert mock_calculate_feature_matrix.call_args[1]["n_jobs"] == 2
+    assert mock_calculate_feature_matrix.call_args[1]["chunk_size"] == 0.5
+
+
 def test_transform(X_y_binary, X_y_multi, X_y_regression):
     datasets = locals()
     for dataset in datasets.values():
@@ -276,6 +310,38 @@ def test_dfs_missing_feature_column(mock_dfs, X_y_binary):
     assert "ABSOLUTE(1)" not in list(X_t.columns)
 
 
+def test_dfs_filter_features_precomputed_at_fit(X_y_binary):
+    X, y = X_y_binary
+    X_pd = pd.DataFrame(X)
+    X_pd.columns = X_pd.columns.astype(str)
+
+    es = ft.EntitySet()
+    es = es.add_dataframe(
+        dataframe_name="X", dataframe=X_pd, index="index", make_index=True
+    )
+    _, features = ft.dfs(
+        entityset=es, target_dataframe_name="X", trans_primitives=["absolute"]
+    )
+
+    dfs = DFSTransformer(features=features)
+    dfs.fit(X_pd)
+    assert len(dfs._feature_column_sets) == len(features)
+
+    X_with_absolute = X_pd.drop("1", axis=1)
+    X_with_absolute["ABSOLUTE(2)"] = X_with_absolute["2"].abs()
+    with patch.object(
+        type(features[-1]), "get_feature_names"
+    ) as mock_get_feature_names:
+        features_to_use = dfs._filter_features(X_with_absolute)
+        mock_get_feature_names.assert_not_called()
+    feature_names = [f.get_name() for f in features_to_use]
+    assert "1" not in feature_names
+    assert "ABSOLUTE(1)" not in feature_names
+    assert "ABSOLUTE(2)" not in feature_names
+    assert "2" in feature_names
+    assert "ABSOLUTE(3)" in feature_names
+
+
 def test_transform_identity_and_non_identity():
     X, y = load_diabetes()
     del X.ww
@@ -331,3 +397,76 @@ def test_dfs_multi_input_primitive(X_y_binary):
         excluded_cols.append(f"1 / {i}")
     for col in excluded_cols:
         assert col not in X_t.columns
+
+
+def test_dfs_transform_reuses_schema(X_y_binary):
+    X, _ = X_y_binary
+    X_pd = pd.DataFrame(X)
+    X_pd.columns = X_pd.columns.astype(str)
+    X_expected = DFSTransformer().fit_transform(X_pd)
+
+    with patch(
+        "evalml.utils.woodwork_utils.infer_feature_types", wraps=infer_feature_types
+    ) as mock_infer_feature_types:
+        dfs = DFSTransformer()
+        dfs.fit(X_pd)
+        X_t = dfs.transform(X_pd)
+        mock_infer_feature_types.assert_not_called()
+        assert_frame_equal(X_t, X_expected)
+
+        dfs.transform(X_pd.astype("float32"))
+        mock_infer_feature_types.assert_called_once()
+
+        mock_infer_feature_types.reset_mock()
+        dfs = DFSTransformer(features=_absolute_features(X_pd.copy()))
+        dfs.fit(X_pd)
+        mock_infer_feature_types.assert_not_called()
+        dfs.transform(X_pd)
+        dfs.transform(X_pd)
+        mock_infer_feature_types.assert_called_once()
+
+
+def test_dfs_transform_reflects_in_place_edits():
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0], "b": [5.0, 6.0, 7.0, 8.0]})
+    dfs = DFSTransformer(features=_absolute_features(X.copy()))
+    dfs.fit(X)
+    X_t = dfs.transform(X)
+    assert X_t["ABSOLUTE(a)"].iloc[0] == 1.0
+
+    X.loc[0, "a"] = -100.0
+    X_t = dfs.transform(X)
+    assert X_t["ABSOLUTE(a)"].iloc[0] == 100.0
+
+
+@pytest.mark.parametrize("index_column", [None, "index"])
+def test_dfs_identity_features_skip_calculate_feature_matrix(index_column):
+    X = pd.DataFrame(
+        {
+            "a": [1.5, 2, 3, 4],
+            "b": [1, 2, 3, 4],
+            "c": pd.Series(["x", "y", "x", "y"], dtype="category"),
+        },
+        index=[10, 11, 12, 13],
+    )
+    if index_column:
+        X[index_column] = [5, 6, 7, 8]
+    dfs = DFSTransformer()
+    dfs.fit(X)
+    assert all(isinstance(f, IdentityFeature) for f in dfs.features)
+
+    es = dfs._make_entity_set(infer_feature_types(X))
+    X_expected = ft.calculate_feature_matrix(features=dfs.features, entityset=es)
+
+    with patch(
+        "evalml.pipelines.components.transformers.preprocessing.featuretools.calculate_feature_matrix"
+    ) as mock_calculate_feature_matrix:
+        X_t = dfs.transform(X)
+        mock_calculate_feature_matrix.assert_not_called()
+    assert_frame_equal(X_t, X_expected)
+    assert X_t.ww.logical_types == X_expected.ww.logical_types
+
+    if index_column:
+        X_duplicate_index = X.copy()
+        X_duplicate_index[index_column] = [0, 0, 2, 3]
+        with pytest.raises(IndexError, match="Index column must be unique"):
+            dfs.transform(X_duplicate_index)
@@ -58,14 +58,15 @@ def test_no_undersample(data_type, make_data_type, X_y_binary):
     undersampler = Undersampler()
     new_X, new_y = undersampler.fit_transform(X, y)
 
-    np.testing.assert_equal(X, new_X.values)
-    np.testing.assert_equal(y, new_y.values)
+    np.testing.assert_array_equal(X, new_X.to_numpy())
+    np.testing.assert_array_equal(y, new_y.to_numpy())
 
 
 @pytest.mark.parametrize("data_type", ["np", "pd", "ww"])
-def test_undersampler_imbalanced_output(data_type, make_data_type):
-    X = np.array([[i] for i in range(1000)])
-    y = np.array([0] * 150 + [1] * 850)
+def test_undersampler_imbalanced_output(
+    data_type, make_data_type, X_y_imbalanced_binary
+):
+    X, y = X_y_imbalanced_binary
     X = make_data_type(data_type, X)
     y = make_data_type(data_type, y)
 
@@ -97,9 +98,8 @@ def test_undersampler_imbalanced_output(data_type, make_data_type):
         ({1: 0.1}, "Sampling dictionary contains a different number"),
     ],
 )
-def test_undersampler_sampling_dict_errors(dictionary, msg):
-    X = np.array([[i] for i in range(1000)])
-    y = np.array(["minority"] * 150 + ["majority"] * 850)
+def test_undersampler_sampling_dict_errors(dictionary, msg, X_y_imbalanced_binary_str):
+    X, y = X_y_imbalanced_binary_str
 
     undersampler = Undersampler(sampling_ratio_dict=dictionary)
     with pytest.raises(ValueError, match=msg):
@@ -116,9 +116,10 @@ def test_undersampler_sampling_dict_errors(dictionary, msg):
         ({0: 0.1, 1: 1}, {0: 150, 1: 150}),
     ],
 )
-def test_undersampler_sampling_dict(sampling_ratio_dict, expected_dict_values):
-    X = np.array([[i] for i in range(1000)])
-    y = np.array([0] * 150 + [1] * 850)
+def test_undersampler_sampling_dict(
+    sampling_ratio_dict, expected_dict_values, X_y_imbalanced_binary
+):
+    X, y = X_y_imbalanced_binary
     undersampler = Undersampler(sampling_ratio_dict=sampling_ratio_dict, random_seed=12)
     new_X, new_y = undersampler.fit_transform(X, y)
 
@@ -127,9 +128,8 @@ def test_undersampler_sampling_dict(sampling_ratio_dict, expected_dict_values):
     assert undersampler.random_seed == 12
 
 
-def test_undersampler_dictionary_overrides_ratio():
-    X = np.array([[i] for i in range(1000)])
-    y = np.array([0] * 150 + [1] * 850)
+def test_undersampler_dictionary_overrides_ratio(X_y_imbalanced_binary):
+    X, y = X_y_imbalanced_binary
     dictionary = {0: 1, 1: 0.5}
     expected_result = {0: 150, 1: 300}
     undersampler = Undersampler(sampling_ratio=0.1, sampling_ratio_dict=dictionary)
@@ -139,9 +139,8 @@ def test_undersampler_dictionary_overrides_ratio():
     assert new_y.value_counts().to_dict() == expected_result
 
 
-def test_undersampler_sampling_dict_strings():
-    X = np.array([[i] for i in range(1000)])
-    y = np.array(["minority"] * 150 + ["majority"] * 850)
+def test_undersampler_sampling_dict_strings(X_y_imbalanced_binary_str):
+    X, y = X_y_imbalanced_binary_str
     dictionary = {"minority": 1, "majority": 0.5}
     expected_result = {"minority": 150, "majority": 300}
     undersampler = Undersampler(sampling_ratio_dict=dictionary)
@@ -470,6 +470,26 @@ def X_y_binary_cls():
     return pd.DataFrame(X), pd.Series(y)
 
 
+def _read_only(*arrays):
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def X_y_imbalanced_binary():
+    X = np.arange(1000).reshape(-1, 1)
+    y = np.repeat([0, 1], [150, 850])
+    return _read_only(X, y)
+
+
+@pytest.fixture(scope="session")
+def X_y_imbalanced_binary_str():
+    X = np.arange(1000).reshape(-1, 1)
+    y = np.repeat(["minority", "majority"], [150, 850])
+    return _read_only(X, y)
+
+
 @pytest.fixture
 def X_y_regression():
     X, y = datasets.make_regression(
@@ -19,6 +19,7 @@ from evalml.utils.gen_utils import (
     contains_all_ts_parameters,
     convert_to_seconds,
     deprecate_arg,
+    drop_rows_with_nans,
     get_importable_subclasses,
     get_random_seed,
     import_or_raise,
@@ -852,3 +853,29 @@ def test_year_start_separated_by_gap():
     assert are_datasets_separated_by_gap_time_index(
         train, test, {"time_index": "time_index", "gap": 2}
     )
+
+
+@pytest.mark.parametrize(
+    "X",
+    [
+        pd.DataFrame({"a": [np.nan, 2.0, 3.0, 4.0], "b": [4, 5, 6, 7]}),
+        pd.DataFrame({"a": [np.nan, 2.0, 3.0, 4.0], "b": [4.0, np.nan, 6.0, 7.0]}),
+        pd.DataFrame(
+            {"a": [np.nan, 2.0, 3.0, 4.0], "b": np.array([4, np.nan, 6, 7], "float32")}
+        ),
+        pd.DataFrame({"a": [np.nan, 2.0, 3.0, 4.0], "b": ["a", None, "c", "d"]}),
+        pd.DataFrame(
+            {
+                "a": pd.Series([None, 2.0, 3.0, 4.0], dtype="Float64"),
+                "b": [True, False, True, False],
+            }
+        ),
+        pd.DataFrame({"a": [1, 2, 3, 4], "b": [True, False, True, False]}),
+    ],
+)
+def test_drop_rows_with_nans(X):
+    y = pd.Series([1, 2, np.nan, 4])
+    X_t, y_t = drop_rows_with_nans(X, y)
+    expected_mask = ~X.isna().any(axis=1) & ~y.isna()
+    pd.testing.assert_frame_equal(X_t, X[expected_mask])
+    pd.testing.assert_series_equal(y_t, y[expected_mask])
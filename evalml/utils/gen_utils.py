@@ -349,6 +349,13 @@ def pad_with_nans(pd_data, num_to_pad):
     )
 
 
+def _has_only_numpy_numeric_dtypes(df):
+    """Checks whether all columns of a dataframe are backed by numpy boolean, integer or float dtypes."""
+    return all(
+        isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in df.dtypes
+    )
+
+
 def _get_rows_without_nans(*data):
     """Compute a boolean array marking where all entries in the data are non-nan.
 
@@ -366,6 +373,14 @@ def _get_rows_without_nans(*data):
         if isinstance(pd_data, pd.Series):
             return ~pd_data.isna().values
         elif isinstance(pd_data, pd.DataFrame):
+            if _has_only_numpy_numeric_dtypes(pd_data):
+                # Only float columns can hold NaNs. When every column is a float, check the frame's
+                # values in one pass without the copy select_dtypes would make.
+                float_kinds = [dtype.kind == "f" for dtype in pd_data.dtypes]
+                if not any(float_kinds):
+                    return np.ones(len(pd_data), dtype=bool)
+                if all(float_kinds):
+                    return ~np.isnan(pd_data.to_numpy()).any(axis=1)
             return ~pd_data.isna().any(axis=1).values
         else:
             return pd_data
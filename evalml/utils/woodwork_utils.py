@@ -75,6 +75,39 @@ def infer_feature_types(data, feature_types=None):
         return ww_data
 
 
+def _infer_feature_types_with_schema(data, schema):
+    """Initialize Woodwork on pandas data with a previously inferred schema, falling back to ``infer_feature_types`` when the schema does not match the data.
+
+    This only saves type inference for data without a Woodwork schema, such as pandas data passed to a component directly. Data that
+    already has a schema, as components receive inside a pipeline, keeps its own schema through ``infer_feature_types``, which does not
+    re-run inference for it.
+
+    Args:
+        data (pd.DataFrame, pd.Series, np.ndarray): Input data to convert to a Woodwork data structure.
+        schema (ww.TableSchema, ww.ColumnSchema): Schema inferred earlier for data with the same columns and dtypes, or None.
+
+    Returns:
+        A Woodwork data structure with the cached schema if it is valid for the data, otherwise with inferred types.
+    """
+    if (
+        schema is None
+        or not isinstance(data, (pd.DataFrame, pd.Series))
+        or data.ww.schema is not None
+    ):
+        return infer_feature_types(data)
+    if isinstance(data, pd.DataFrame):
+        if not ww.is_schema_valid(data, schema):
+            return infer_feature_types(data)
+        ww_data = data.copy()
+        ww_data.ww.init(schema=schema)
+        return ww_data
+    if str(data.dtype) != str(schema.logical_type.primary_dtype):
+        return infer_feature_types(data)
+    return ww.init_series(
+        data, logical_type=schema.logical_type, semantic_tags=schema.semantic_tags
+    )
+
+
 def _convert_numeric_dataset_pandas(X, y):
     """Convert numeric and non-null data to pandas datatype. Raises ValueError if there is null or non-numeric data. Used with data sampler strategies.
 